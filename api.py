@@ -1,4 +1,5 @@
 import requests
+import streamlit as st
 from bs4 import BeautifulSoup
 import re
 from textblob import TextBlob
@@ -6,10 +7,14 @@ import nltk
 from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 import io
-from gtts import gTTS
+import os
+import threading
+from urllib.parse import urlparse
+import numpy as np
 import random
-import time
 import logging
 from datetime import datetime
 
@@ -25,6 +30,12 @@ except LookupError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Path to the Piper Hindi voice model (the matching .onnx.json must sit next to it)
+PIPER_HINDI_VOICE = os.getenv("PIPER_HINDI_VOICE", "hi_IN-priyamvada-medium.onnx")
+
+# Maximum number of concurrent requests sent to any single news site
+MAX_REQUESTS_PER_HOST = 2
+
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
@@ -51,6 +62,7 @@ def format_date(date_str):
         logger.error(f"Error formatting date {date_str}: {e}")
         return date_str
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_news(company_name, num_articles=10):
     """Fetch and extract news articles related to the company"""
     articles = []
@@ -76,54 +88,31 @@ def fetch_news(company_name, num_articles=10):
         ]
         sources.extend(example_urls)
     
-    # Process each source
+    # Avoid overwhelming servers: cap concurrent requests per host
+    host_limits = {}
     for source in sources:
-        try:
-            time.sleep(1)  # Avoid overwhelming servers
-            response = requests.get(source, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            if "google.com" in source:
-                for item in soup.select('div.SoaBEf'):
-                    link_elem = item.find('a')
-                    if link_elem and link_elem.get('href'):
-                        article_url = link_elem['href']
-                        article_data = extract_article_data(article_url, company_name)
-                        if article_data:
-                            articles.append(article_data)
-                            if len(articles) >= num_articles:
-                                break
-            elif "economictimes" in source:
-                for item in soup.select('div.eachStory'):
-                    link_elem = item.find('a')
-                    if link_elem and link_elem.get('href'):
-                        article_url = "https://economictimes.indiatimes.com" + link_elem['href']
-                        article_data = extract_article_data(article_url, company_name)
-                        if article_data:
-                            articles.append(article_data)
-                            if len(articles) >= num_articles:
-                                break
-            elif "business-standard" in source:
-                for item in soup.select('div.listing-main'):
-                    link_elem = item.find('a')
-                    if link_elem and link_elem.get('href'):
-                        article_url = "https://www.business-standard.com" + link_elem['href']
-                        article_data = extract_article_data(article_url, company_name)
-                        if article_data:
-                            articles.append(article_data)
-                            if len(articles) >= num_articles:
-                                break
-            elif source.startswith("http"):
-                # Direct article URLs
-                article_data = extract_article_data(source, company_name)
-                if article_data:
-                    articles.append(article_data)
-        except Exception as e:
-            logger.error(f"Error processing source {source}: {e}")
-            continue
-        
-        if len(articles) >= num_articles:
-            break
+        host_limits.setdefault(urlparse(source).netloc, threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+    
+    # Collect candidate article URLs from every source concurrently
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        url_lists = list(executor.map(
+            lambda source: call_with_host_limit(host_limits, source, get_article_urls, source, headers),
+            sources
+        ))
+    candidate_urls = list(dict.fromkeys(url for urls in url_lists for url in urls))
+    for url in candidate_urls:
+        host_limits.setdefault(urlparse(url).netloc, threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+    
+    # Fetch, parse and analyze articles concurrently, topping up until enough succeed
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while candidate_urls and len(articles) < num_articles:
+            needed = num_articles - len(articles)
+            batch, candidate_urls = candidate_urls[:needed], candidate_urls[needed:]
+            results = executor.map(
+                lambda url: call_with_host_limit(host_limits, url, extract_article_data, url, company_name),
+                batch
+            )
+            articles.extend(article for article in results if article)
                 
     # Generate mock data if needed
     while len(articles) < num_articles:
@@ -131,6 +120,40 @@ def fetch_news(company_name, num_articles=10):
     
     return articles[:num_articles]
 
+def call_with_host_limit(host_limits, url, func, *args):
+    """Call func while holding one of the request slots for the URL's host"""
+    with host_limits[urlparse(url).netloc]:
+        return func(*args)
+
+def get_article_urls(source, headers):
+    """Get the article URLs listed on a news source page"""
+    listing_selectors = {
+        "google.com": ('div.SoaBEf', ""),
+        "economictimes": ('div.eachStory', "https://economictimes.indiatimes.com"),
+        "business-standard": ('div.listing-main', "https://www.business-standard.com"),
+    }
+    
+    try:
+        for domain, (selector, base_url) in listing_selectors.items():
+            if domain in source and "search?" in source:
+                response = requests.get(source, headers=headers, timeout=10)
+                soup = BeautifulSoup(response.text, 'html.parser')
+                
+                urls = []
+                for item in soup.select(selector):
+                    link_elem = item.find('a')
+                    if link_elem and link_elem.get('href'):
+                        urls.append(base_url + link_elem['href'])
+                return urls
+        
+        # Direct article URLs
+        if source.startswith("http"):
+            return [source]
+    except Exception as e:
+        logger.error(f"Error processing source {source}: {e}")
+    
+    return []
+
 def extract_article_data(url, company_name):
     """Extract data from a news article URL"""
     try:
@@ -218,9 +241,6 @@ def extract_article_data(url, company_name):
         # Calculate reading time
         reading_time = calculate_reading_time(content)
         
-        # Generate audio summary
-        audio_summary = text_to_speech_hindi(summary)
-        
         return {
             'title': clean_text(title),
             'summary': summary,
@@ -230,8 +250,7 @@ def extract_article_data(url, company_name):
             'source': source,
             'sentiment': sentiment,
             'topics': topics,
-            'reading_time': reading_time,
-            'audio_summary': audio_summary
+            'reading_time': reading_time
         }
     except Exception as e:
         logger.error(f"Error extracting data from {url}: {e}")
@@ -356,20 +375,20 @@ def truncate_text(text, max_length=100):
 
     return text[:max_length].rsplit(' ', 1)[0] + '...'
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def generate_comparative_analysis(articles):
     """Generate comparative analysis across all articles"""
     # Count sentiments
-    sentiment_counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
-    sentiment_scores = []
-    all_topics = []
+    label_codes = {"Positive": 0, "Neutral": 1, "Negative": 2}
+    codes = np.fromiter((label_codes[article['sentiment']['label']] for article in articles), dtype=np.intp, count=len(articles))
+    code_counts = np.bincount(codes, minlength=len(label_codes))
+    sentiment_counts = {label: int(code_counts[code]) for label, code in label_codes.items()}
     
-    for article in articles:
-        sentiment_counts[article['sentiment']['label']] += 1
-        sentiment_scores.append(article['sentiment']['score'])
-        all_topics.extend(article['topics'])
+    sentiment_scores = np.fromiter((article['sentiment']['score'] for article in articles), dtype=np.float64, count=len(articles))
+    all_topics = [topic for article in articles for topic in article['topics']]
     
     # Calculate average sentiment score
-    average_sentiment_score = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+    average_sentiment_score = float(sentiment_scores.mean()) if sentiment_scores.size else 0
     
     # Find common topics
     topic_counts = Counter(all_topics)
@@ -486,6 +505,7 @@ def generate_comparative_analysis(articles):
         'final_sentiment_analysis': final_sentiment
     }
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def generate_overall_summary(company_name, articles, comparative_analysis):
     """Generate an overall summary of all the news articles"""
     # Get the most common sentiment
@@ -519,19 +539,104 @@ def generate_overall_summary(company_name, articles, comparative_analysis):
     
     return summary
 
-def text_to_speech_hindi(text):
-    """Convert text to Hindi speech"""
+def split_hindi_sentences(text, min_length=20):
+    """Split text into sentences on Hindi and English sentence punctuation"""
+    abbreviation = re.compile(r'\b(?:mr|mrs|dr|inc|ltd|co|corp|vs|st)\.$', re.IGNORECASE)
+    
+    sentences = []
+    buffer = ""
+    for part in re.split(r'(?<=[।\.\?\!])\s+', text.strip()):
+        buffer = f"{buffer} {part}".strip() if buffer else part
+        
+        # Keep accumulating across abbreviations and very short fragments
+        if abbreviation.search(buffer) or len(buffer) < min_length:
+            continue
+        
+        sentences.append(buffer)
+        buffer = ""
+    
+    if buffer:
+        sentences.append(buffer)
+    
+    return sentences
+
+@st.cache_resource(show_spinner=False)
+def load_piper_voice():
+    """Load the local Piper Hindi voice once, or return None if it is unavailable"""
+    # Optional on-device Hindi TTS; gTTS is used when it is not installed
+    if importlib.util.find_spec("lameenc") is None:
+        return None
+    try:
+        from piper import PiperVoice
+    except ImportError:
+        return None
+    
+    # synthesize_with_piper relies on the chunked synthesize() API from piper-tts 1.3
+    if not hasattr(PiperVoice, "synthesize_wav"):
+        logger.warning("piper-tts is older than 1.3, using gTTS for Hindi speech")
+        return None
+    
+    if not os.path.exists(PIPER_HINDI_VOICE):
+        return None
     try:
-        tts = gTTS(text=text, lang='hi', slow=False)
+        return PiperVoice.load(PIPER_HINDI_VOICE)
+    except Exception as e:
+        logger.error(f"Error loading Piper voice {PIPER_HINDI_VOICE}: {e}")
+        return None
+
+def synthesize_with_piper(voice, sentence):
+    """Convert a single sentence to speech with a local Piper voice, returning MP3 bytes"""
+    import lameenc
+    
+    pcm_io = io.BytesIO()
+    sample_rate = voice.config.sample_rate
+    for chunk in voice.synthesize(sentence):
+        pcm_io.write(chunk.audio_int16_bytes)
+        sample_rate = chunk.sample_rate
+    
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(64)
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(1)
+    encoder.set_quality(2)
+    return bytes(encoder.encode(pcm_io.getvalue()) + encoder.flush())
+
+def synthesize_hindi_sentence(sentence, voice=None):
+    """Convert a single sentence to Hindi speech, returning MP3 bytes; raises on failure"""
+    if voice is not None:
+        try:
+            return synthesize_with_piper(voice, sentence)
+        except Exception as e:
+            logger.error(f"Error generating Hindi speech with Piper, falling back to gTTS: {e}")
+    
+    try:
+        # Imported lazily to keep gTTS off the app's startup path
+        from gtts import gTTS
+        tts = gTTS(text=sentence, lang='hi', slow=False)
         audio_io = io.BytesIO()
         tts.write_to_fp(audio_io)
-        audio_io.seek(0)
-        return audio_io.read()
+        return audio_io.getvalue()
     except Exception as e:
-        logger.error(f"Error generating Hindi speech: {e}")
-        # Return an empty audio if there's an error
-        return None
+        logger.error(f"Error generating Hindi speech for sentence: {e}")
+        raise
 
+@st.cache_resource(max_entries=64, show_spinner=False)
+def text_to_speech_hindi(text):
+    """Convert text to Hindi speech, returning raw MP3 bytes; raises if any sentence fails"""
+    # Raise rather than return None so Streamlit does not cache the failure
+    sentences = split_hindi_sentences(text)
+    if not sentences:
+        raise ValueError("No Hindi speech generated for empty text")
+    
+    # Prefer the local voice, which avoids a network round-trip per sentence
+    voice = load_piper_voice()
+    
+    # Synthesize sentences concurrently; map returns results in the original order
+    # and MP3 frames can be concatenated directly
+    with ThreadPoolExecutor(max_workers=min(8, len(sentences))) as executor:
+        return b"".join(executor.map(lambda sentence: synthesize_hindi_sentence(sentence, voice), sentences))
+
+@st.cache_data(ttl=86400, max_entries=512, show_spinner=False)
 def translate_to_hindi(text):
     """Translate English text to Hindi using a simple rule-based approach"""
     # Dictionary mapping for simple translations
@@ -579,6 +684,22 @@ def translate_to_hindi(text):
     
     return text
 
+@st.cache_data(ttl=86400, max_entries=512, show_spinner=False)
+def translate_to_hindi_batch(texts):
+    """Translate several texts in a single pass by joining them with a separator"""
+    if not texts:
+        return []
+    
+    separator = "\n###SEP###\n"
+    translated = translate_to_hindi(separator.join(texts)).split(separator)
+    
+    # Fall back to one call per text if the separator did not survive translation
+    if len(translated) != len(texts):
+        logger.warning("Batch translation split mismatch, translating texts individually")
+        return [translate_to_hindi(text) for text in texts]
+    
+    return translated
+
 def generate_mock_article(company_name, index):
     """Generate mock article data for testing/development"""
     sentiments = ["Positive", "Neutral", "Negative"]
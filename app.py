@@ -1,24 +1,26 @@
 import streamlit as st
 import json
 import os
+import shutil
 import base64
-from datetime import datetime
 from api import (
     fetch_news,
     analyze_sentiment,
     generate_comparative_analysis,
-    text_to_speech_hindi,
-    translate_to_hindi,
     generate_overall_summary
 )
 from utils import (
     clean_text,
-    truncate_text,
-    save_to_json,
-    get_cached_data,
-    create_cache_dir
+    truncate_text
 )
 
+# CSS class for each sentiment label
+SENTIMENT_CLASSES = {
+    "Positive": "sentiment-positive",
+    "Negative": "sentiment-negative",
+    "Neutral": "sentiment-neutral"
+}
+
 # Page configuration
 st.set_page_config(
     page_title="Company News Analyzer & Summarizer",
@@ -27,80 +29,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Load the stylesheet once per server process
+@st.cache_resource
+def load_css():
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"
+
 # Add some CSS styling
-st.markdown("""
-<style>
-    .main {
-        padding: 1rem;
-    }
-    .report-section {
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        background-color: #f8f9fa;
-        margin-bottom: 1rem;
-    }
-    .sentiment-positive {
-        color: #28a745;
-        font-weight: bold;
-    }
-    .sentiment-negative {
-        color: #dc3545;
-        font-weight: bold;
-    }
-    .sentiment-neutral {
-        color: #6c757d;
-        font-weight: bold;
-    }
-    .article-title {
-        font-weight: bold;
-        font-size: 1.1rem;
-    }
-    .article-source {
-        color: #6c757d;
-        font-style: italic;
-    }
-    .stExpander {
-        border: 1px solid #f0f0f0;
-    }
-    h1, h2, h3 {
-        margin-bottom: 1rem;
-    }
-    .summary-box {
-        background-color: #e9ecef;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .topic-tag {
-        background-color: #e7f5ff;
-        padding: 0.2rem 0.5rem;
-        border-radius: 0.3rem;
-        margin-right: 0.5rem;
-        display: inline-block;
-    }
-    .comparison-box {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-        border-left: 3px solid #007bff;
-    }
-    .impact-box {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-        border-left: 3px solid #28a745;
-    }
-    .overlap-box {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-        border-left: 3px solid #ffc107;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Title and description
 st.title("📰 Company News Sentiment Analysis")
@@ -125,10 +62,16 @@ num_articles = st.sidebar.slider("Number of articles to analyze", min_value=5, m
 # Cache control
 use_cache = st.sidebar.checkbox("Use cached data if available", value=True)
 if st.sidebar.button("Clear cache"):
-    cache_dir = create_cache_dir()
-    for file in os.listdir(cache_dir):
-        if file.endswith('.json'):
-            os.remove(os.path.join(cache_dir, file))
+    st.cache_data.clear()
+    
+    # Remove the on-disk cache left behind by earlier versions of the app
+    shutil.rmtree('cache', ignore_errors=True)
+    
+    # Drop this session's stored analysis and audio so the next click recomputes
+    from api import text_to_speech_hindi
+    text_to_speech_hindi.clear()
+    for key in ("analysis", "analysis_key", "hindi_audio", "hindi_audio_requested"):
+        st.session_state.pop(key, None)
     st.sidebar.success("Cache cleared!")
 
 # Language options
@@ -148,278 +91,326 @@ with st.sidebar.expander("About the application"):
     Built with Streamlit, NLTK, TextBlob, and gTTS.
     """)
 
-# Progress view holder
-progress_placeholder = st.empty()
-
 # Main function to analyze news
 def analyze_company_news(company_name, num_articles, use_cache):
     """
     Analyze news for the given company
     """
-    # Check if cached data is available
-    if use_cache:
-        cached_data = get_cached_data(company_name)
-        if cached_data and len(cached_data.get('articles', [])) >= num_articles:
-            st.success(f"Using cached data for {company_name} from {cached_data.get('timestamp', 'recent')}!")
-            return cached_data.get('articles', [])[:num_articles]
-    
-    # Display progress
-    progress_bar = progress_placeholder.progress(0)
-    progress_text = progress_placeholder.empty()
+    # fetch_news is memoized by Streamlit; drop stale results when caching is disabled
+    if not use_cache:
+        fetch_news.clear()
     
     # Fetch news data
-    progress_text.text("Fetching news articles...")
-    news_data = fetch_news(company_name, num_articles)
-    progress_bar.progress(50)
-    
-    # Update progress
-    progress_text.text("Analyzing content and generating summaries...")
-    progress_bar.progress(100)
-    
-    # Clear progress indicators
-    progress_bar.empty()
-    progress_text.empty()
-    
-    # Cache the results
-    cache_dir = create_cache_dir()
-    cache_data = {
-        'company': company_name,
-        'articles': news_data,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }
-    save_to_json(cache_data, os.path.join(cache_dir, f"{company_name.lower().replace(' ', '')}.json"))
+    with st.spinner(f"Fetching {num_articles} articles about {company_name}..."):
+        news_data = fetch_news(company_name, num_articles)
     
     return news_data
 
+# Get Hindi speech for a text from the cache shared across sessions, memoized per session
+def get_hindi_audio(text):
+    audio_cache = st.session_state.setdefault("hindi_audio", {})
+    if text not in audio_cache:
+        from api import text_to_speech_hindi
+        
+        try:
+            with st.spinner("Generating Hindi audio..."):
+                audio_cache[text] = text_to_speech_hindi(text)
+        except Exception:
+            # Failures are logged in api.py and not cached, so the next run retries
+            st.warning("Could not generate Hindi audio. Please try again.")
+            return None
+    return audio_cache[text]
+
 # Generate a play button for audio
 def get_audio_button(text, language="en", button_text="Listen"):
-    audio_file = text_to_speech_hindi(text) if language == "hi" else None
+    audio_file = get_hindi_audio(text) if language == "hi" else None
     if audio_file:
         return st.audio(audio_file, format="audio/mp3")
     return None
 
+# Render one article tab
+def render_article_tab(article, lang, hindi_article_summary):
+    # Article header
+    st.markdown(f"<h3 class='article-title'>{article['title']}</h3>", unsafe_allow_html=True)
+    st.markdown(f"<p class='article-source'>Source: {article['source']} | Date: {article['date']} | Reading time: {article['reading_time']}</p>", unsafe_allow_html=True)
+    
+    # Summary and sentiment
+    st.markdown("### Summary")
+    st.markdown(f"{article['summary']}")
+    
+    # Audio option for Hindi
+    if lang == "Hindi":
+        with st.expander("Hindi Summary"):
+            st.markdown(hindi_article_summary)
+            get_audio_button(hindi_article_summary, "hi", "Play Hindi Summary")
+    
+    sentiment = article['sentiment']
+    sentiment_class = SENTIMENT_CLASSES[sentiment['label']]
+    
+    st.markdown(f"### Sentiment: <span class='{sentiment_class}'>{sentiment['label']} ({sentiment['score']:.2f})</span>", unsafe_allow_html=True)
+    
+    # Topics
+    st.markdown("### Topics")
+    topics_html = "".join(f"<span class='topic-tag'>{topic}</span>" for topic in article['topics'])
+    st.markdown(f"<div>{topics_html}</div>", unsafe_allow_html=True)
+    
+    # Full content in expander
+    with st.expander("View Full Article Content"):
+        st.markdown(article['content'])
+        st.markdown(f"[Read original article]({article['url']})")
+
+# Render the audio download as a fragment so clicking it does not re-run the analysis
+@st.fragment
+def render_audio_export(audio_file, company_name):
+    st.download_button(
+        label="Download Audio Summary (Hindi)",
+        data=audio_file,
+        file_name=f"{company_name}_summary_hindi.mp3",
+        mime="audio/mp3"
+    )
+
+# Build the JSON report for an analysis
+def build_json_report(company_name, news_data, comparative_analysis):
+    return {
+        "Company": company_name,
+        "Articles": [
+            {
+                "Title": article['title'],
+                "Summary": article['summary'],
+                "Sentiment": article['sentiment']['label'],
+                "Topics": article['topics']
+            } for article in news_data
+        ],
+        "Comparative Sentiment Score": {
+            "Sentiment Distribution": comparative_analysis['sentiment_counts'],
+            "Coverage Differences": comparative_analysis['coverage_differences'],
+            "Topic Overlap": {
+                "Common Topics": comparative_analysis['topic_overlap']['Common Topics'],
+                "Most Frequent Topics": comparative_analysis['common_topics']
+            }
+        },
+        "Final Sentiment Analysis": comparative_analysis['final_sentiment_analysis'],
+        "Audio": "[Play Hindi Speech]"
+    }
+
+# Render the JSON view as a fragment so the download click does not re-run the analysis
+@st.fragment
+def render_json_output(company_name, json_data, json_str):
+    # JSON Output View
+    st.header("JSON Output Format")
+    
+    # Display JSON
+    st.json(json_data)
+    
+    # JSON download
+    st.download_button(
+        label="Download Analysis Report (JSON)",
+        data=json_str,
+        file_name=f"{company_name}_analysis.json",
+        mime="application/json"
+    )
+
+# Fetch and analyze news for the given inputs, returning everything needed to render
+def run_analysis(company_name, num_articles, language, use_cache):
+    news_data = analyze_company_news(company_name, num_articles, use_cache)
+    if not news_data:
+        return None
+    
+    comparative_analysis = generate_comparative_analysis(news_data)
+    
+    # Generate overall summary
+    overall_summary = generate_overall_summary(company_name, news_data, comparative_analysis)
+    
+    translations = {}
+    hindi_summary = None
+    if language == "Hindi":
+        from api import translate_to_hindi_batch
+        
+        # Translate everything in one batch; syndicated articles often share a summary,
+        # so each distinct text is translated once
+        texts = list(dict.fromkeys([overall_summary, *(article['summary'] for article in news_data)]))
+        translations = dict(zip(texts, translate_to_hindi_batch(texts)))
+        hindi_summary = translations[overall_summary]
+    
+    # Encode the report once per analysis rather than on every rerun
+    json_report = build_json_report(company_name, news_data, comparative_analysis)
+    
+    return {
+        'company': company_name,
+        'language': language,
+        'news_data': news_data,
+        'comparative_analysis': comparative_analysis,
+        'overall_summary': overall_summary,
+        'hindi_summary': hindi_summary,
+        'translations': translations,
+        'json_report': json_report,
+        'json_str': json.dumps(json_report, indent=2)
+    }
+
 # Analysis button
 if st.button("Analyze Company News"):
     if not selected_company:
         st.error("Please select or enter a company name")
     else:
-        # Fetch and analyze news
-        news_data = analyze_company_news(selected_company, num_articles, use_cache)
+        # Only recompute when the inputs differ from the last analysis
+        analysis_key = (selected_company, num_articles, selected_language)
+        if not use_cache or st.session_state.get("analysis_key") != analysis_key:
+            st.session_state.analysis = run_analysis(selected_company, num_articles, selected_language, use_cache)
+            st.session_state.analysis_key = analysis_key
+        
+        if not st.session_state.analysis:
+            st.error("Failed to fetch news data. Please try again later or with a different company name.")
+
+# Render the last analysis, so reruns from other widgets keep the results on screen
+analysis = st.session_state.get("analysis")
+if analysis:
+    company_name = analysis['company']
+    language = analysis['language']
+    news_data = analysis['news_data']
+    comparative_analysis = analysis['comparative_analysis']
+    overall_summary = analysis['overall_summary']
+    hindi_summary = analysis['hindi_summary']
+    translations = analysis['translations']
+    
+    # Create tabs for different views
+    tab1, tab2 = st.tabs(["Analysis Dashboard", "JSON Output"])
+    
+    with tab1:
+        # ---------- Display Results ----------
+        
+        # Overall Summary Section
+        st.header("📊 Overall Analysis")
+        st.markdown(f"<div class='summary-box'>{overall_summary}</div>", unsafe_allow_html=True)
+        
+        # Hindi translation and audio if selected
+        if language == "Hindi":
+            st.subheader("Hindi Summary")
+            st.markdown(f"<div class='summary-box'>{hindi_summary}</div>", unsafe_allow_html=True)
+            st.subheader("🔊 Audio Summary (Hindi)")
+            audio_file = get_hindi_audio(hindi_summary)
+            if audio_file:
+                st.audio(audio_file, format="audio/mp3")
+        
+        # Sentiment Distribution
+        st.subheader("Sentiment Distribution")
+        
+        # Create columns for the sentiment counts
+        col1, col2, col3 = st.columns(3)
+        
+        sentiment_counts = comparative_analysis['sentiment_counts']
+        with col1:
+            st.metric(
+                label="Positive",
+                value=sentiment_counts['Positive'],
+                delta=f"{(sentiment_counts['Positive']/len(news_data)*100):.0f}%"
+            )
+        
+        with col2:
+            st.metric(
+                label="Neutral",
+                value=sentiment_counts['Neutral'],
+                delta=f"{(sentiment_counts['Neutral']/len(news_data)*100):.0f}%"
+            )
+        
+        with col3:
+            st.metric(
+                label="Negative",
+                value=sentiment_counts['Negative'],
+                delta=f"{(sentiment_counts['Negative']/len(news_data)*100):.0f}%"
+            )
+        
+        # Average sentiment
+        avg_score = comparative_analysis['average_sentiment_score']
+        sentiment_label = "Positive" if avg_score > 0.1 else ("Negative" if avg_score < -0.1 else "Neutral")
+        sentiment_class = SENTIMENT_CLASSES[sentiment_label]
+        
+        st.markdown(f"<p>Average Sentiment: <span class='{sentiment_class}'>{sentiment_label} ({avg_score:.2f})</span></p>", unsafe_allow_html=True)
+        
+        # Topic Overlap Section
+        st.subheader("Topic Analysis")
         
-        if news_data:
-            # Generate comparative analysis
-            comparative_analysis = generate_comparative_analysis(news_data)
+        # Common Topics
+        st.markdown("#### Common Topics Across Articles")
+        common_topics = comparative_analysis['topic_overlap']['Common Topics']
+        
+        if common_topics:
+            topics_html = "".join(f"<span class='topic-tag'>{topic}</span>" for topic in common_topics)
+            st.markdown(f"<div class='overlap-box'>{topics_html}</div>", unsafe_allow_html=True)
+        else:
+            st.markdown("No common topics found across all articles.")
+        
+        # Most Frequent Topics
+        st.markdown("#### Most Frequent Topics")
+        topics_html = "".join(
+            f"<span class='topic-tag'>{topic} ({count})</span>"
+            for topic, count in comparative_analysis['common_topics'][:8]
+        )
+        st.markdown(f"<div>{topics_html}</div>", unsafe_allow_html=True)
+        
+        # Unique Topics by Article
+        st.markdown("#### Unique Topics by Article")
+        unique_topics = comparative_analysis['unique_topics_by_article']
+        
+        if unique_topics:
+            for unique in unique_topics:
+                st.markdown(f"{unique['Title']}: " + ", ".join(unique['Unique Topics']))
+        else:
+            st.markdown("No unique topics identified.")
+        
+        # Coverage Differences
+        st.subheader("Coverage Differences")
+        if comparative_analysis['coverage_differences']:
+            for diff in comparative_analysis['coverage_differences']:
+                st.markdown(f"<div class='comparison-box'><strong>Comparison:</strong> {diff['Comparison']}</div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='impact-box'><strong>Impact:</strong> {diff['Impact']}</div>", unsafe_allow_html=True)
+        else:
+            st.markdown("No significant coverage differences identified.")
+        
+        # Individual Articles
+        st.header("📄 Individual Articles Analysis")
+        
+        # Create tabs
+        tab_labels = [f"Article {i+1}" for i in range(len(news_data))]
+        article_tabs = st.tabs(tab_labels)
+        
+        for tab, article in zip(article_tabs, news_data):
+            with tab:
+                render_article_tab(article, language, translations.get(article['summary']))
+        
+        # Final Sentiment Analysis
+        st.header("🎯 Final Sentiment Analysis")
+        st.markdown(f"<div class='summary-box'>{comparative_analysis['final_sentiment_analysis']}</div>", unsafe_allow_html=True)
+        
+        # Hindi Audio summary, generated in English mode only when requested.
+        # The request is remembered per analysis so the section survives reruns.
+        analysis_key = st.session_state.get("analysis_key")
+        if language != "Hindi" and st.session_state.get("hindi_audio_requested") != analysis_key:
+            if st.button("Generate Hindi audio on demand"):
+                st.session_state.hindi_audio_requested = analysis_key
+        
+        if language == "Hindi" or st.session_state.get("hindi_audio_requested") == analysis_key:
+            if hindi_summary is None:
+                from api import translate_to_hindi
+                hindi_summary = translate_to_hindi(overall_summary)
             
-            # Generate overall summary
-            overall_summary = generate_overall_summary(selected_company, news_data, comparative_analysis)
+            st.header("🔊 Audio Summary (Hindi)")
             
-            # Create tabs for different views
-            tab1, tab2 = st.tabs(["Analysis Dashboard", "JSON Output"])
+            # Display Hindi text
+            with st.expander("View Hindi Text"):
+                st.text(hindi_summary)
             
-            with tab1:
-                # ---------- Display Results ----------
-                
-                # Overall Summary Section
-                st.header("📊 Overall Analysis")
-                st.markdown(f"<div class='summary-box'>{overall_summary}</div>", unsafe_allow_html=True)
-                
-                # Hindi translation and audio if selected
-                if selected_language == "Hindi":
-                    hindi_summary = translate_to_hindi(overall_summary)
-                    st.subheader("Hindi Summary")
-                    st.markdown(f"<div class='summary-box'>{hindi_summary}</div>", unsafe_allow_html=True)
-                    st.subheader("🔊 Audio Summary (Hindi)")
-                    get_audio_button(hindi_summary, "hi", "Play Hindi Summary")
-                
-                # Sentiment Distribution
-                st.subheader("Sentiment Distribution")
-                
-                # Create columns for the sentiment counts
-                col1, col2, col3 = st.columns(3)
-                
-                sentiment_counts = comparative_analysis['sentiment_counts']
-                with col1:
-                    st.metric(
-                        label="Positive",
-                        value=sentiment_counts['Positive'],
-                        delta=f"{(sentiment_counts['Positive']/len(news_data)*100):.0f}%"
-                    )
-                
-                with col2:
-                    st.metric(
-                        label="Neutral",
-                        value=sentiment_counts['Neutral'],
-                        delta=f"{(sentiment_counts['Neutral']/len(news_data)*100):.0f}%"
-                    )
-                
-                with col3:
-                    st.metric(
-                        label="Negative",
-                        value=sentiment_counts['Negative'],
-                        delta=f"{(sentiment_counts['Negative']/len(news_data)*100):.0f}%"
-                    )
-                
-                # Average sentiment
-                avg_score = comparative_analysis['average_sentiment_score']
-                sentiment_class = "sentiment-positive" if avg_score > 0.1 else ("sentiment-negative" if avg_score < -0.1 else "sentiment-neutral")
-                sentiment_label = "Positive" if avg_score > 0.1 else ("Negative" if avg_score < -0.1 else "Neutral")
-                
-                st.markdown(f"<p>Average Sentiment: <span class='{sentiment_class}'>{sentiment_label} ({avg_score:.2f})</span></p>", unsafe_allow_html=True)
-                
-                # Topic Overlap Section
-                st.subheader("Topic Analysis")
-                
-                # Common Topics
-                st.markdown("#### Common Topics Across Articles")
-                common_topics = comparative_analysis['topic_overlap']['Common Topics']
-                
-                if common_topics:
-                    topics_html = ""
-                    for topic in common_topics:
-                        topics_html += f"<span class='topic-tag'>{topic}</span>"
-                    st.markdown(f"<div class='overlap-box'>{topics_html}</div>", unsafe_allow_html=True)
-                else:
-                    st.markdown("No common topics found across all articles.")
-                
-                # Most Frequent Topics
-                st.markdown("#### Most Frequent Topics")
-                topics_html = ""
-                for topic, count in comparative_analysis['common_topics'][:8]:
-                    topics_html += f"<span class='topic-tag'>{topic} ({count})</span>"
-                
-                st.markdown(f"<div>{topics_html}</div>", unsafe_allow_html=True)
-                
-                # Unique Topics by Article
-                st.markdown("#### Unique Topics by Article")
-                unique_topics = comparative_analysis['unique_topics_by_article']
-                
-                if unique_topics:
-                    for unique in unique_topics:
-                        st.markdown(f"{unique['Title']}: " + ", ".join(unique['Unique Topics']))
-                else:
-                    st.markdown("No unique topics identified.")
-                
-                # Coverage Differences
-                st.subheader("Coverage Differences")
-                if comparative_analysis['coverage_differences']:
-                    for diff in comparative_analysis['coverage_differences']:
-                        st.markdown(f"<div class='comparison-box'><strong>Comparison:</strong> {diff['Comparison']}</div>", unsafe_allow_html=True)
-                        st.markdown(f"<div class='impact-box'><strong>Impact:</strong> {diff['Impact']}</div>", unsafe_allow_html=True)
-                else:
-                    st.markdown("No significant coverage differences identified.")
-                
-                # Individual Articles
-                st.header("📄 Individual Articles Analysis")
-                
-                # Create tabs
-                tab_labels = [f"Article {i+1}" for i in range(len(news_data))]
-                article_tabs = st.tabs(tab_labels)
-                
-                for i, (tab, article) in enumerate(zip(article_tabs, news_data)):
-                    with tab:
-                        # Article header
-                        st.markdown(f"<h3 class='article-title'>{article['title']}</h3>", unsafe_allow_html=True)
-                        st.markdown(f"<p class='article-source'>Source: {article['source']} | Date: {article['date']} | Reading time: {article['reading_time']}</p>", unsafe_allow_html=True)
-                        
-                        # Summary and sentiment
-                        st.markdown("### Summary")
-                        st.markdown(f"{article['summary']}")
-                        
-                        # Audio option for Hindi
-                        if selected_language == "Hindi":
-                            hindi_article_summary = translate_to_hindi(article['summary'])
-                            with st.expander("Hindi Summary"):
-                                st.markdown(hindi_article_summary)
-                                get_audio_button(hindi_article_summary, "hi", "Play Hindi Summary")
-                        
-                        sentiment = article['sentiment']
-                        sentiment_class = "sentiment-positive" if sentiment['label'] == "Positive" else ("sentiment-negative" if sentiment['label'] == "Negative" else "sentiment-neutral")
-                        
-                        st.markdown(f"### Sentiment: <span class='{sentiment_class}'>{sentiment['label']} ({sentiment['score']:.2f})</span>", unsafe_allow_html=True)
-                        
-                        # Topics
-                        st.markdown("### Topics")
-                        topics_html = ""
-                        for topic in article['topics']:
-                            topics_html += f"<span class='topic-tag'>{topic}</span>"
-                        st.markdown(f"<div>{topics_html}</div>", unsafe_allow_html=True)
-                        
-                        # Full content in expander
-                        with st.expander("View Full Article Content"):
-                            st.markdown(article['content'])
-                            st.markdown(f"[Read original article]({article['url']})")
-                
-                # Final Sentiment Analysis
-                st.header("🎯 Final Sentiment Analysis")
-                st.markdown(f"<div class='summary-box'>{comparative_analysis['final_sentiment_analysis']}</div>", unsafe_allow_html=True)
-                
-                # Hindi Audio summary
-                st.header("🔊 Audio Summary (Hindi)")
-                
-                # Translate summary to Hindi
-                hindi_summary = translate_to_hindi(overall_summary)
-                
-                # Display Hindi text
-                with st.expander("View Hindi Text"):
-                    st.text(hindi_summary)
-                
-                # Generate and play audio
-                with st.spinner("Generating Hindi audio..."):
-                    audio_file = text_to_speech_hindi(hindi_summary)
-                    st.audio(audio_file, format="audio/mp3")
-                
-                # Export options
-                st.header("📥 Export Results")
-                
-                # Audio download
-                st.download_button(
-                    label="Download Audio Summary (Hindi)",
-                    data=audio_file,
-                    file_name=f"{selected_company}_summary_hindi.mp3",
-                    mime="audio/mp3"
-                )
+            # Play audio
+            audio_file = get_hindi_audio(hindi_summary)
+            if audio_file:
+                st.audio(audio_file, format="audio/mp3")
             
-            with tab2:
-                # JSON Output View
-                st.header("JSON Output Format")
-                
-                # Prepare JSON data
-                json_data = {
-                    "Company": selected_company,
-                    "Articles": [
-                        {
-                            "Title": article['title'],
-                            "Summary": article['summary'],
-                            "Sentiment": article['sentiment']['label'],
-                            "Topics": article['topics']
-                        } for article in news_data
-                    ],
-                    "Comparative Sentiment Score": {
-                        "Sentiment Distribution": comparative_analysis['sentiment_counts'],
-                        "Coverage Differences": comparative_analysis['coverage_differences'],
-                        "Topic Overlap": {
-                            "Common Topics": comparative_analysis['topic_overlap']['Common Topics'],
-                            "Most Frequent Topics": comparative_analysis['common_topics']
-                        }
-                    },
-                    "Final Sentiment Analysis": comparative_analysis['final_sentiment_analysis'],
-                    "Audio": "[Play Hindi Speech]"
-                }
-                
-                # Display JSON
-                st.json(json_data)
-                
-                # JSON download
-                json_str = json.dumps(json_data, indent=2)
-                
-                st.download_button(
-                    label="Download Analysis Report (JSON)",
-                    data=json_str,
-                    file_name=f"{selected_company}_analysis.json",
-                    mime="application/json"
-                )
-        else:
-            st.error("Failed to fetch news data. Please try again later or with a different company name.")
+            # Export options, only when audio was generated successfully
+            if audio_file:
+                st.header("📥 Export Results")
+                render_audio_export(audio_file, company_name)
+    
+    with tab2:
+        render_json_output(company_name, analysis['json_report'], analysis['json_str'])
 
 # Instructions at the bottom
 st.markdown("---")
@@ -1,8 +1,6 @@
-import os
 import re
 import logging
 from datetime import datetime
-import json
 
 # Set up logging
 logging.basicConfig(
@@ -60,12 +58,6 @@ def format_date(date_str):
         logger.error(f"Error formatting date {date_str}: {e}")
         return date_str
 
-def generate_cache_key(company_name):
-    """
-    Generate a cache key for storing fetched news data
-    """
-    return f"{company_name.lower().replace(' ', '')}{datetime.now().strftime('%Y%m%d')}"
-
 def calculate_reading_time(text):
     """
     Calculate estimated reading time in minutes
@@ -93,58 +85,6 @@ def truncate_text(text, max_length=100):
 
     return text[:max_length].rsplit(' ', 1)[0] + '...'
 
-def save_to_json(data, filename):
-    """
-    Save data to a JSON file
-    """
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving to JSON: {e}")
-        return False
-
-def load_from_json(filename):
-    """
-    Load data from a JSON file
-    """
-    try:
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
-    except Exception as e:
-        logger.error(f"Error loading from JSON: {e}")
-        return None
-
-def create_cache_dir():
-    """
-    Create a cache directory if it doesn't exist
-    """
-    cache_dir = 'cache'
-    if not os.path.exists(cache_dir):
-        os.makedirs(cache_dir)
-    return cache_dir
-
-def get_cached_data(company_name, max_age_hours=6):
-    """
-    Get cached data for a company if available and not too old
-    """
-    cache_dir = create_cache_dir()
-    cache_key = generate_cache_key(company_name)
-    cache_file = os.path.join(cache_dir, f"{cache_key}.json")
-
-    if os.path.exists(cache_file):
-        # Check file age
-        file_time = os.path.getmtime(cache_file)
-        age_hours = (datetime.now().timestamp() - file_time) / 3600
-
-        if age_hours <= max_age_hours:
-            return load_from_json(cache_file)
-
-    return None
-
 def predict_stock_trend(sentiment_counts, avg_sentiment_score):
     """
     Predict potential stock trend based on sentiment analysis